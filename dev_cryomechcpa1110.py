@@ -41,6 +41,12 @@ class Device(dev_generic.Device):
                 f"Modbus connection on port {device['Address']} couldn't be opened")
         self.device_connected = True
 
+    def close(self):
+        """Close the Modbus connection."""
+        if self.client is not None:
+            self.client.close()
+        self.device_connected = False
+
     def read_float_value(self, register):
         """
         Read float value from register `register` (int).
@@ -52,29 +52,37 @@ class Device(dev_generic.Device):
         except serial.SerialException:
             raise DeviceError(
                 f"Serial connection on port {device['Address']} couldn't be opened")
+        # Query and response prefixes, which only depend on the internal address of the gauge
+        internal_address = self.device["DeviceSpecificParams"]["InternalAddress"]
+        self._prefix_q = f'#{internal_address}'.encode(encoding="ASCII")
+        self._prefix_r = f'*{internal_address} '.encode(encoding="ASCII")
+
+    def close(self):
+        """Close the serial connection."""
+        self.connection.close()
 
     def query(self, command):
         """Query device with command `command` (str) and return response."""
-        internal_address = self.device["DeviceSpecificParams"]["InternalAddress"]
-        query = f'#{internal_address}{command}\r'.encode(encoding="ASCII")
+        query = self._prefix_q + f'{command}\r'.encode(encoding="ASCII")
         n_write_bytes = self.connection.write(query)
         if n_write_bytes != len(query):
             raise DeviceError("Failed to write to device")
+        # Validate the raw response and only decode the payload
         rsp = self.connection.readline()
-        try:
-            rsp = rsp.decode(encoding="ASCII")
-        except UnicodeDecodeError:
-            raise DeviceError(f"Error in decoding response ('{rsp}') received")
-        if rsp == '':
+        if not rsp:
             raise DeviceError(
                 "No response received")
-        if rsp.startswith("?"):
+        if rsp.startswith(b"?"):
             raise DeviceError(
-                f"Received an error response: '{rsp}'")
-        if not rsp.startswith(f"*{internal_address} "):
+                f"Received an error response: '{rsp.decode(encoding='ASCII', errors='replace')}'")
+        if not rsp.startswith(self._prefix_r):
             raise DeviceError(
-                f"Didn't receive correct acknowledgement (response received: '{rsp}')")
-        return rsp[4:]
+                "Didn't receive correct acknowledgement (response received: "
+                +f"'{rsp.decode(encoding='ASCII', errors='replace')}')")
+        try:
+            return rsp[len(self._prefix_r):].decode(encoding="ASCII")
+        except UnicodeDecodeError:
+            raise DeviceError(f"Error in decoding response ('{rsp}') received")
 
     def read_pressure(self):
         """Read pressure."""
@@ -37,6 +37,10 @@ class Device(dev_generic.Device):
             raise DeviceError(
                 f"Serial connection on port {device['Address']} couldn't be opened")
 
+    def close(self):
+        """Close the serial connection."""
+        self.connection.close()
+
     def align_msg(self, byte_string, length=8):
         """
         Find and return a message within a given byte string that starts with the byte 0x07,
@@ -50,10 +54,14 @@ class Device(dev_generic.Device):
             bytes or None: If a valid message is found, it returns the message as a bytes object.
                         If no valid message is found, it returns None.
         """
-        for i in range(len(byte_string) - length):
+        # Only compute the checksum at positions of the start byte
+        end = max(len(byte_string) - length, 0)
+        i = byte_string.find(0x07, 0, end)
+        while i != -1:
             checksum = sum(byte_string[i+1: i + length]) & 0xFF
-            if byte_string[i] == 0x07 and checksum == int(byte_string[i + length]):
+            if checksum == byte_string[i + length]:
                 return byte_string[i: i + length]
+            i = byte_string.find(0x07, i + 1, end)
         return None
 
     def get_message(self):
@@ -31,6 +31,10 @@ class Device(dev_generic.Device):
             raise DeviceError(
                 f"Serial connection with {device['Device']} couldn't be opened")
 
+    def close(self):
+        """Close the serial connection."""
+        self.connection.close()
+
     def to_readings(self, message):
         """Converts raw message string from device into floating point values by channel order."""
         keys = [str(key, 'utf-8') for key in message[-2].split(b',')[1:11]]
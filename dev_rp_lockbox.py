@@ -22,10 +22,13 @@ class Device(dev_generic.Device):
     :num_out: the output channel to use (1 or 2)
     """
     delimiter = '\r\n'
+    _delimiter_bytes = delimiter.encode('utf-8')
 
     def connect(self):
         """Open a new TCP/IP socket and connect to the configured hostname and port."""
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Receive buffer that is reused for all reads from the socket
+        self._rx_buf = bytearray(4096 + len(self._delimiter_bytes))
         if (timeout := self.device.get('Timeout')) is not None:
             self._socket.settimeout(timeout)
 
@@ -49,15 +52,24 @@ class Device(dev_generic.Device):
 
         :chunksize: number of bytes to receive at once (default: 4096)
         """
-        msg = ''
+        # Receive into the preallocated buffer, collect the received bytes and only decode the
+        # complete message
+        size = chunksize + len(self._delimiter_bytes)
+        if len(self._rx_buf) < size:
+            self._rx_buf = bytearray(size)
+        rx_view = memoryview(self._rx_buf)
+        buf = bytearray()
         while 1:
-            chunk = self._socket.recv(chunksize + len(self.delimiter)).decode('utf-8')
             # Receive chunk size of 2^n preferably
-            msg += chunk
-            if chunk and chunk[-2:] == self.delimiter:
+            n = self._socket.recv_into(rx_view, size)
+            if not n:
+                raise DeviceError('Connection closed by device')
+            buf += rx_view[:n]
+            if buf.endswith(self._delimiter_bytes):
                 break
-        logger.debug("RX: %s", msg[:-2])
-        return msg[:-2]
+        msg = buf[:-len(self._delimiter_bytes)].decode('utf-8')
+        logger.debug("RX: %s", msg)
+        return msg
 
     def tx_txt(self, msg):
         """Send text string and append delimiter.
@@ -66,7 +78,7 @@ class Device(dev_generic.Device):
         """
         logger.debug("TX: %s", msg)
         try:
-            self._socket.send((msg + self.delimiter).encode('utf-8'))
+            self._socket.send(msg.encode('utf-8') + self._delimiter_bytes)
         except (OSError, socket.timeout) as err:
             logger.error("Failed to send message to socket. Error: %s", err)
 
@@ -32,6 +32,10 @@ class Device(dev_generic.Device):
             raise DeviceError(
                 f"Serial connection with {device['Device']} couldn't be opened")
 
+    def close(self):
+        """Close the serial connection."""
+        self.connection.close()
+
     def generate_query(self, command):
         """Generate serial query to request value for command `command` (str)."""
         return (
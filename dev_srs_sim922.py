@@ -4,6 +4,7 @@ Stanford Research Instruments (SRS) SIM922 diode temperature monitor.
 """
 
 import logging
+from operator import methodcaller
 
 from amodevices import SRSSIM922
 from amodevices.dev_exceptions import DeviceError
@@ -20,18 +21,24 @@ class Device(SRSSIM922):
             Configuration dict of the device to initialize.
         """
         super(Device, self).__init__(device)
+        self._plan = self.resolve_channels()
 
-    def get_values(self):
-        """Read channels"""
-        chans = self.device['Channels']
-        readings = {}
-        for channel_id, chan in chans.items():
+    def resolve_channels(self):
+        """
+        Resolve the getter of each channel once, returning a list of tuples
+        (channel ID, getter), where the getter takes the device instance as argument.
+        """
+        plan = []
+        for channel_id, chan in self.device['Channels'].items():
             if chan['Type'] == 'Temperature' \
                     and (device_channel := chan['DeviceChannel']) in range(1, 5):
-                value = self.read_temperature(device_channel)
-                readings[channel_id] = value
+                plan.append((channel_id, methodcaller('read_temperature', device_channel)))
             else:
                 raise DeviceError(
                     f'Unknown channel type \'{chan["Type"]}\' for channel \'{channel_id}\''
                     + f' of device \'{self.device["Device"]}\'')
-        return readings
+        return plan
+
+    def get_values(self):
+        """Read channels."""
+        return {channel_id: getter(self) for channel_id, getter in self._plan}
@@ -31,6 +31,10 @@ class Device(dev_generic.Device):
             raise DeviceError(
                 f"Serial connection on port {device['Address']} couldn't be opened")
 
+    def close(self):
+        """Close the serial connection."""
+        self.connection.close()
+
     def query(self, command):
         """Query device with command `command` (str) and return response."""
         query = f"{command}\n".encode(encoding="ASCII")
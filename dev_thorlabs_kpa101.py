@@ -4,6 +4,7 @@ Thorlabs KPA101 beam position aligner.
 """
 
 import logging
+from operator import attrgetter
 
 from amodevices import ThorlabsKPA101
 from amodevices.dev_exceptions import DeviceError
@@ -12,6 +13,17 @@ logger = logging.getLogger()
 
 class Device(ThorlabsKPA101):
 
+    # Getters for the supported channel types
+    _RESOLVERS = {
+        'XDiff': attrgetter('xdiff'),
+        'YDiff': attrgetter('ydiff'),
+        'Sum': attrgetter('sum'),
+        'XPos': attrgetter('xpos'),
+        'YPos': attrgetter('ypos'),
+        'XPosPDP90A': attrgetter('xpos_pdp90a'),
+        'YPosPDP90A': attrgetter('ypos_pdp90a'),
+        }
+
     def __init__(self, device):
         """
         Initialize device.
@@ -20,28 +32,23 @@ class Device(ThorlabsKPA101):
             Configuration dict of the device to initialize.
         """
         super(Device, self).__init__(device)
+        self._plan = self.resolve_channels()
 
-    def get_values(self):
-        """Read channels."""
-        chans = self.device['Channels']
-        readings = {}
-        for channel_id, chan in chans.items():
-            if chan['Type'] == 'XDiff':
-                readings[channel_id] = self.xdiff
-            elif chan['Type'] == 'YDiff':
-                readings[channel_id] = self.ydiff
-            elif chan['Type'] == 'Sum':
-                readings[channel_id] = self.sum
-            elif chan['Type'] == 'XPos':
-                readings[channel_id] = self.xpos
-            elif chan['Type'] == 'YPos':
-                readings[channel_id] = self.ypos
-            elif chan['Type'] == 'XPosPDP90A':
-                readings[channel_id] = self.xpos_pdp90a
-            elif chan['Type'] == 'YPosPDP90A':
-                readings[channel_id] = self.ypos_pdp90a
-            else:
+    def resolve_channels(self):
+        """
+        Resolve the getter of each channel once, returning a list of tuples
+        (channel ID, getter), where the getter takes the device instance as argument.
+        """
+        plan = []
+        for channel_id, chan in self.device['Channels'].items():
+            getter = self._RESOLVERS.get(chan['Type'])
+            if getter is None:
                 raise DeviceError(
                     f'Unknown channel type \'{chan["Type"]}\' for channel \'{channel_id}\''
                     +f' of device \'{self.device["Device"]}\'')
-        return readings
+            plan.append((channel_id, getter))
+        return plan
+
+    def get_values(self):
+        """Read channels."""
+        return {channel_id: getter(self) for channel_id, getter in self._plan}
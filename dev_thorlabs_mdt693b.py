@@ -4,6 +4,7 @@ Thorlabs MDT693B 3-axis piezo controller.
 """
 
 import logging
+from operator import methodcaller
 
 from amodevices import ThorlabsMDT693B
 from amodevices.dev_exceptions import DeviceError
@@ -20,17 +21,23 @@ class Device(ThorlabsMDT693B):
             Configuration dict of the device to initialize.
         """
         super(Device, self).__init__(device)
+        self._plan = self.resolve_channels()
 
-    def get_values(self):
-        """Read channels."""
-        chans = self.device['Channels']
-        readings = {}
-        for channel_id, chan in chans.items():
+    def resolve_channels(self):
+        """
+        Resolve the getter of each channel once, returning a list of tuples
+        (channel ID, getter), where the getter takes the device instance as argument.
+        """
+        plan = []
+        for channel_id, chan in self.device['Channels'].items():
             if chan['Type'] in ['Vout']:
-                value = self.read_voltage(chan['Axis'])
-                readings[channel_id] = value
+                plan.append((channel_id, methodcaller('read_voltage', chan['Axis'])))
             else:
                 raise DeviceError(
                     f'Unknown channel type \'{chan["Type"]}\' for channel \'{channel_id}\''
                     +f' of device \'{self.device["Device"]}\'')
-        return readings
+        return plan
+
+    def get_values(self):
+        """Read channels."""
+        return {channel_id: getter(self) for channel_id, getter in self._plan}
@@ -4,6 +4,7 @@ Thorlabs PM100 power meter.
 """
 
 import logging
+from operator import attrgetter
 
 from amodevices import ThorlabsPM100
 from amodevices.dev_exceptions import DeviceError
@@ -12,6 +13,17 @@ logger = logging.getLogger()
 
 class Device(ThorlabsPM100):
 
+    # Getters for the supported channel types
+    _RESOLVERS = {
+        'PowerUnit': attrgetter('power.unit'),
+        'PowerAutoRange': attrgetter('power.auto_range'),
+        'Power': attrgetter('power.value'),
+        'Wavelength': attrgetter('wavelength'),
+        'BeamDiameter': attrgetter('beam_diameter'),
+        'NumAverages': attrgetter('num_averages'),
+        'ZeroMagnitude': attrgetter('zero_magnitude'),
+        }
+
     def __init__(self, device):
         """
         Initialize device.
@@ -20,31 +32,26 @@ class Device(ThorlabsPM100):
             Configuration dict of the device to initialize.
         """
         super(Device, self).__init__(device)
+        self._plan = self.resolve_channels()
 
         # Set power unit to watt (W)
         self.power.unit = 'W'
 
-    def get_values(self):
-        """Read channels."""
-        chans = self.device['Channels']
-        readings = {}
-        for channel_id, chan in chans.items():
-            if chan['Type'] == 'PowerUnit':
-                readings[channel_id] = self.power.unit
-            elif chan['Type'] == 'PowerAutoRange':
-                readings[channel_id] = self.power.auto_range
-            elif chan['Type'] == 'Power':
-                readings[channel_id] = self.power.value
-            elif chan['Type'] == 'Wavelength':
-                readings[channel_id] = self.wavelength
-            elif chan['Type'] == 'BeamDiameter':
-                readings[channel_id] = self.beam_diameter
-            elif chan['Type'] == 'NumAverages':
-                readings[channel_id] = self.num_averages
-            elif chan['Type'] == 'ZeroMagnitude':
-                readings[channel_id] = self.zero_magnitude
-            else:
+    def resolve_channels(self):
+        """
+        Resolve the getter of each channel once, returning a list of tuples
+        (channel ID, getter), where the getter takes the device instance as argument.
+        """
+        plan = []
+        for channel_id, chan in self.device['Channels'].items():
+            getter = self._RESOLVERS.get(chan['Type'])
+            if getter is None:
                 raise DeviceError(
                     f'Unknown channel type \'{chan["Type"]}\' for channel \'{channel_id}\''
                     +f' of device \'{self.device["Device"]}\'')
-        return readings
+            plan.append((channel_id, getter))
+        return plan
+
+    def get_values(self):
+        """Read channels."""
+        return {channel_id: getter(self) for channel_id, getter in self._plan}
@@ -48,6 +48,19 @@ SET_ERRORS = {
     -20: "ResERR_NoLegitimation"
 }
 
+# Return and argument types of the functions of the wavelength meter library used by the logger
+# (i.e., when initializing the wavemeter and reading the frequency) and of the functions returning
+# a double, as (restype, argtypes)
+WLM_FUNCTION_TYPES = {
+    "Instantiate": (ctypes.c_long, [ctypes.c_long, ctypes.c_long, ctypes.c_long, ctypes.c_long]),
+    "SetPIDSetting": (
+        ctypes.c_long, [ctypes.c_long, ctypes.c_long, ctypes.c_long, ctypes.c_double]),
+    "GetFrequencyNum": (ctypes.c_double, [ctypes.c_long, ctypes.c_double]),
+    "GetWavelengthNum": (ctypes.c_double, [ctypes.c_long, ctypes.c_double]),
+    "GetDeviationSignal": (ctypes.c_double, [ctypes.c_double]),
+    "GetDeviationReference": (ctypes.c_double, [ctypes.c_double]),
+}
+
 class Wavemeter():
     """Class for the wavemeter. Emits newExposures, newLevels, newWavenumber and
     newDeviationSignal Qt signals."""
@@ -59,6 +72,10 @@ class Wavemeter():
         """
         super().__init__()
         self.device_present = False
+        # Arguments and buffers passed to the DLL calls, which are allocated only once
+        self._double_zero = ctypes.c_double(0)
+        self._bool_false = ctypes.c_bool(False)
+        self._strbuf = ctypes.create_string_buffer(1024)
 
         try:
             self.wlm_lib = ctypes.WinDLL(library_path)
@@ -67,10 +84,19 @@ class Wavemeter():
             LOG.error(msg)
             raise DeviceError(msg)
         else:
-            self.wlm_lib.GetFrequencyNum.restype = ctypes.c_double
-            self.wlm_lib.GetWavelengthNum.restype = ctypes.c_double
-            self.wlm_lib.GetDeviationSignal.restype = ctypes.c_double
-            self.wlm_lib.GetDeviationReference.restype = ctypes.c_double
+            # Declare return and argument types, so that ctypes does not have to infer them
+            # on each call
+            for name, (restype, argtypes) in WLM_FUNCTION_TYPES.items():
+                try:
+                    function = getattr(self.wlm_lib, name)
+                except AttributeError as err:
+                    msg = (
+                        f"Function '{name}' not found in HighFinesse Wavelength Meter library."
+                        +f" Error: {err}")
+                    LOG.error(msg)
+                    raise DeviceError(msg)
+                function.restype = restype
+                function.argtypes = argtypes
 
             retval = self.wlm_lib.Instantiate(cInstResetCalc, 0, 0, 0)
             if retval == 0:
@@ -82,7 +108,7 @@ class Wavemeter():
 
             # Set the wavelength meter to report frequencies
             retval = self.wlm_lib.SetPIDSetting(
-                cmiDeviationUnit, 1, cReturnFrequency, ctypes.c_double(0))
+                cmiDeviationUnit, 1, cReturnFrequency, self._double_zero)
 
     def set_pid_setpoint(self, setpoint):
         """Set the PID setpoint.
@@ -105,8 +131,8 @@ class Wavemeter():
         if not self.device_present:
             LOG.warning("get_pid_setpoint() called for non-present HighFinesse wavemeter.")
             return -1
-        strbuf = ctypes.create_string_buffer(1024)
-        self.wlm_lib.GetPIDCourseNum(1, ctypes.byref(strbuf))
+        strbuf = self._strbuf
+        self.wlm_lib.GetPIDCourseNum(1, strbuf)
         return float(strbuf.value.lstrip(b"= ").replace(b",", b"."))
 
     def set_pid_status(self, status):
@@ -118,7 +144,7 @@ class Wavemeter():
             LOG.warning("set_pid_status(%s) called for non-present HighFinesse wavemeter.", status)
             return
 
-        retval = self.wlm_lib.SetDeviationMode(ctypes.c_bool(status))
+        retval = self.wlm_lib.SetDeviationMode(status)
         if retval != 0:
             LOG.error("Could not set PID status. Error: %s", SET_ERRORS[retval])
 
@@ -169,7 +195,7 @@ class Wavemeter():
         if not self.device_present:
             LOG.warning("update_pid_output_voltage() called for non-present HighFinesse wavemeter.")
             return -1.0
-        return self.wlm_lib.GetDeviationSignal(ctypes.c_double(0))
+        return self.wlm_lib.GetDeviationSignal(self._double_zero)
 
     def get_exposures(self):
         """Return the current exposure times.
@@ -201,7 +227,7 @@ class Wavemeter():
         if not self.device_present:
             LOG.warning("get_frequency() called for non-present HighFinesse wavemeter.")
             return None
-        return self.wlm_lib.GetFrequencyNum(1, ctypes.c_double(0))
+        return self.wlm_lib.GetFrequencyNum(1, self._double_zero)
 
     def get_automatic_exposure(self):
         """Return if automatic exposure is enabled.
@@ -212,7 +238,7 @@ class Wavemeter():
         if not self.device_present:
             LOG.warning("get_automatic_exposure() called for non-present HighFinesse wavemeter.")
             return False
-        return self.wlm_lib.GetExposureMode(ctypes.c_bool(False))
+        return self.wlm_lib.GetExposureMode(self._bool_false)
 
     def get_pid_enabled(self):
         """"Return if the PID controller is enabled.
@@ -222,4 +248,4 @@ class Wavemeter():
         if not self.device_present:
             LOG.warning("get_pid_enabled() called for non-present HighFinesse wavemeter.")
             return False
-        return self.wlm_lib.GetDeviationMode(ctypes.c_bool(False))
+        return self.wlm_lib.GetDeviationMode(self._bool_false)
@@ -5,106 +5,115 @@ Multi-purpose data logging software.
 @author: Lothar Maisenbacher/Berkeley.
 """
 import numpy as np
+import math
 import configparser
-import json
+import orjson
 import time
 import logging
 import argparse
+import importlib
+import atexit
+import itertools
+import threading
+import signal
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from defs import LoggerError
 from amodevices.dev_exceptions import DeviceError
 
+import urllib3
 import influxdb_client
 from influxdb_client.client.write_api import SYNCHRONOUS
 from influxdb_client.client.exceptions import InfluxDBError
 
-# Device modules
-import dev_keysightdaq973a
-import dev_smchrs012
-import dev_purpleair
-import dev_kjlc354
-import dev_kjlc_acg
-import dev_metonedr528
-import dev_srsctc100
-import dev_cryomechcpa1110
-import dev_highfinesse
-import dev_rp_lockbox
-import dev_thorlabs_kpa101
-import dev_thorlabs_mdt693b
-import dev_thorlabs_pm100
-import dev_pydase
-import dev_srs_sim922
-
 logger = logging.getLogger()
 
 CONFIGPATH_DEFAULT = 'config.ini'
 
-def init_device(device):
-    """
-    Initialize the device and return an instance of the device class.
-
-    device : dict
-        Configuration dict of the device to initialize.
-    """
-    logger.info(
-        'Trying to initialize device \'%s\' of model \'%s\'', device['Device'], device['Model'])
-
-    device_instance = None
-
+# Device modules by model name, as used in the field `Model` of the device configuration.
+# The modules are only imported when a device of the given model is initialized.
+DEVICE_MODELS = {
     # Keysight DAQ970A/973A multimeter (via VISA interface)
-    if device['Model'] == 'Keysight DAQ973A':
-        device_instance = dev_keysightdaq973a.Device(device)
+    'Keysight DAQ973A': 'dev_keysightdaq973a',
     # SMC HRS012-AN-10-T chiller (via RS-232 port)
-    if device['Model'] == 'SMC HRS012-AN-10-T':
-        device_instance = dev_smchrs012.Device(device)
+    'SMC HRS012-AN-10-T': 'dev_smchrs012',
     # PurpleAir air quality sensor/particle counters (via web API)
-    if device['Model'] == 'PurpleAir':
-        device_instance = dev_purpleair.Device(device)
+    'PurpleAir': 'dev_purpleair',
     # Kurt J. Lesker KJLC 354 series ion pressure gauge (via RS-485 port)
-    if device['Model'] == 'KJLC 354':
-        device_instance = dev_kjlc354.Device(device)
+    'KJLC 354': 'dev_kjlc354',
     # Kurt J. Lesker KJLC ACG series ambient capacitance manometer (via RS-232 port)
-    if device['Model'] == 'KJLC ACG':
-        device_instance = dev_kjlc_acg.Device(device)
+    'KJLC ACG': 'dev_kjlc_acg',
     # Met One DR-528 handheld particle counter (via RS-232 port)
-    if device['Model'] == 'Met One DR-528':
-        device_instance = dev_metonedr528.Device(device)
+    'Met One DR-528': 'dev_metonedr528',
     # Stanford Research Instruments CTC100 cryogenic temperature controller
     # (via USB interface/virtual serial port)
-    if device['Model'] == 'SRS CTC100':
-        device_instance = dev_srsctc100.Device(device)
+    'SRS CTC100': 'dev_srsctc100',
     # Cryomech CPA1110 helium compressor
     # (using Modbus TCP protocol over ethernet interface)
-    if device['Model'] == 'Cryomech CPA1110':
-        device_instance = dev_cryomechcpa1110.Device(device)
+    'Cryomech CPA1110': 'dev_cryomechcpa1110',
     # HighFinesse wavemeter
     # (using Windows DLL API)
-    if device['Model'] == 'HighFinesse':
-        device_instance = dev_highfinesse.Device(device)
+    'HighFinesse': 'dev_highfinesse',
     # Red Pitaya lockbox (rp-lockbox)
-    if device['Model'] == 'rp-lockbox':
-        device_instance = dev_rp_lockbox.Device(device)
+    'rp-lockbox': 'dev_rp_lockbox',
     # Thorlabs KPA101 beam position aligner
-    if device['Model'] == 'Thorlabs KPA101':
-        device_instance = dev_thorlabs_kpa101.Device(device)
-    # Thorlabs KPA101 beam position aligner
-    if device['Model'] == 'Thorlabs MDT693B':
-        device_instance = dev_thorlabs_mdt693b.Device(device)
+    'Thorlabs KPA101': 'dev_thorlabs_kpa101',
+    # Thorlabs MDT693B 3-axis piezo controller
+    'Thorlabs MDT693B': 'dev_thorlabs_mdt693b',
     # Thorlabs PM100 power meter
-    if device['Model'] == 'Thorlabs PM100':
-        device_instance = dev_thorlabs_pm100.Device(device)
+    'Thorlabs PM100': 'dev_thorlabs_pm100',
     # pydase RPC server
-    if device['Model'] == 'pydase':
-        device_instance = dev_pydase.Device(device)
+    'pydase': 'dev_pydase',
     # Stanford Research Instruments (SRS) SIM922 diode temperature monitor (through RS-232 port)
-    if device['Model'] == 'SRS SIM922':
-        device_instance = dev_srs_sim922.Device(device)
-    # Unknown device
-    if device_instance is None:
-        msg = f'Unknown device model \'{device["Model"]}\''
+    'SRS SIM922': 'dev_srs_sim922',
+}
+
+# Maximum number of points written to the database in a single request
+MAX_BATCH_SIZE = 5000
+
+# Character escapes of InfluxDB line protocol for measurement names, for tag keys, tag values,
+# and field keys, and for string field values
+_LP_ESCAPE_MEASUREMENT = str.maketrans({
+    ',': r'\,', ' ': r'\ ', '\n': r'\n', '\t': r'\t', '\r': r'\r'})
+_LP_ESCAPE_KEY = str.maketrans({
+    ',': r'\,', '=': r'\=', ' ': r'\ ', '\n': r'\n', '\t': r'\t', '\r': r'\r'})
+_LP_ESCAPE_STRING = str.maketrans({'"': r'\"', '\\': r'\\'})
+
+def get_device_module(model):
+    """
+    Import and return the module of the device class of device model `model` (str).
+    """
+    try:
+        device_module = DEVICE_MODELS[model]
+    except KeyError:
+        # Unknown device
+        msg = f'Unknown device model \'{model}\''
         logger.error(msg)
         raise LoggerError(msg)
+    return importlib.import_module(device_module)
+
+
+def init_device(device):
+    """
+    Initialize the device and return an instance of the device class.
+    Returns None if the device class could not be instantiated, e.g., because of an invalid
+    channel configuration, so that the other devices can still be read out.
+
+    device : dict
+        Configuration dict of the device to initialize.
+    """
+    logger.info(
+        'Trying to initialize device \'%s\' of model \'%s\'', device['Device'], device['Model'])
+
+    device_class = get_device_module(device['Model']).Device
+    try:
+        device_instance = device_class(device)
+    except (LoggerError, DeviceError) as err:
+        logger.error(
+            'Could not initialize device \'%s\', skipping device. Error: %s',
+            device['Device'], err.value)
+        return None
 
     try:
         device_instance.connect()
@@ -114,6 +123,119 @@ def init_device(device):
     return device_instance
 
 
+def close_device(device, device_instance):
+    """
+    Close the connection to the device, if supported by the device class.
+
+    device : dict
+        Configuration dict of the device.
+    device_instance : object
+        Instance of the device class.
+    """
+    logger.info('Closing device \'%s\'', device['Device'])
+    close = getattr(device_instance, 'close', None)
+    if close is None:
+        return
+    try:
+        close()
+    except (LoggerError, DeviceError, OSError) as err:
+        logger.warning(
+            'Could not close device \'%s\'. Error: %s',
+            device['Device'], getattr(err, 'value', err))
+
+
+def prepare_channels(device):
+    """
+    Precompute the properties of the channels of the device needed to write measured values
+    to the database, and store them in the configuration dicts of the channels.
+
+    device : dict
+        Configuration dict of the device.
+    """
+    for channel in device['Channels'].values():
+        # Tags of device, merged with tags of channel
+        channel['_merged_tags'] = {
+            'device': device['Device'],
+            **device['tags'],
+            **channel.get('tags', {})
+        }
+        # Series (measurement and tags) and field key of points written to database,
+        # in line protocol. Tags are sorted by key and empty tags are skipped,
+        # as done by influxdb-client.
+        tags_str = ''.join([
+            f',{str(key).translate(_LP_ESCAPE_KEY)}={str(value).translate(_LP_ESCAPE_KEY)}'
+            for key, value in sorted(channel['_merged_tags'].items())
+            if value is not None and value != ''])
+        channel['_lp_series'] = (
+            f'{device["measurement"].translate(_LP_ESCAPE_MEASUREMENT)}{tags_str}')
+        channel['_lp_field_key'] = channel['field-key'].translate(_LP_ESCAPE_KEY)
+        # Multiplier of measured values (None if no multiplier is set)
+        channel['_multiplier'] = channel.get('Multiplier')
+        # Coefficients and exponents of polynomial converter (None if no converter is set)
+        if 'Converter' in channel and channel['Converter'].get('Type') == 'polynomial':
+            coeffs_dict = channel['Converter'].get('Coefficients', {})
+            channel['_polynomial'] = (
+                np.array(list(coeffs_dict.values())),
+                np.array(list(coeffs_dict.keys())).astype(int))
+        else:
+            channel['_polynomial'] = None
+        # Unit appended to measured values in log messages
+        unit = channel['_merged_tags'].get('unit')
+        channel['_unit_str'] = ' '+unit if unit is not None else ''
+
+
+def format_field_value(value):
+    """
+    Format field value `value` for InfluxDB line protocol.
+    Returns None for values that cannot be written (NaN or infinite values).
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, np.integer)):
+        return f'{int(value)}i'
+    if isinstance(value, str):
+        return f'"{value.translate(_LP_ESCAPE_STRING)}"'
+    value = float(value)
+    if not math.isfinite(value):
+        return None
+    return repr(value)
+
+
+def read_config(config_path):
+    """
+    Read the configuration file and return it as `configparser.ConfigParser` instance.
+
+    config_path : pathlib.Path
+        Absolute path to the configuration file.
+    """
+    logger.info('Reading configuration from file \'%s\'', config_path)
+    conf = configparser.ConfigParser()
+    files_read = conf.read(config_path)
+    if str(config_path) not in files_read:
+        msg = f'Could not read configuration file \'{config_path}\''
+        logger.error(msg)
+        raise LoggerError(msg)
+    return conf
+
+
+def read_device_config(device_config_path):
+    """
+    Read the device configuration file and return the list of configuration dicts of the devices.
+
+    device_config_path : pathlib.Path
+        Path to the device configuration file.
+    """
+    logger.info('Reading device configuration from file \'%s\'',
+                device_config_path)
+    try:
+        with open(device_config_path, 'rb') as device_config:
+            return orjson.loads(device_config.read())
+    except FileNotFoundError as e:
+        msg = f'Could not read device configuration file \'{device_config_path}\': {e}'
+        logger.error(msg)
+        raise LoggerError(msg)
+
+
 def _setup_logging():
     """Configure the application logging setup."""
     logging.basicConfig(level=logging.INFO)
@@ -128,21 +250,20 @@ if __name__ == "__main__":
     parser.add_argument(
         '-c', '--config', dest='configpath', help='Path to configuration file', required=False,
         default=CONFIGPATH_DEFAULT)
-    config_path = Path(parser.parse_args().configpath).absolute()
+    parser.add_argument(
+        '-w', '--watch', dest='watch', action='store_true',
+        help='Reload device configuration file when it is modified')
+    args = parser.parse_args()
+    config_path = Path(args.configpath).absolute()
 
     # Read config file
-    logger.info('Reading configuration from file \'%s\'', config_path)
-    CONF = configparser.ConfigParser()
-    files_read = CONF.read(config_path)
-    if str(config_path) not in files_read:
-        msg = f'Could not read configuration file \'{config_path}\''
-        logger.error(msg)
-        raise LoggerError(msg)
+    CONF = read_config(config_path)
 
     DB_URL = CONF["Database"]["url"]
     DB_BUCKET = CONF["Database"]["bucket"]
     DB_ORG = CONF["Database"]["org"]
     DB_TOKEN = CONF["Database"]["token"]
+    DB_GZIP = CONF["Database"].getboolean("gzip", fallback=True)
     UPDATE_INTERVAL = int(CONF["Update"]["interval"])
     TIMEOUT = int(CONF["Devices"]["timeout"])
 
@@ -151,95 +272,279 @@ if __name__ == "__main__":
     if not device_config_path.is_absolute():
         device_config_path = config_path.parent.joinpath(device_config_path)
 
-    # Set up database connection
+    # Set up database connection. The client keeps a pool of persistent HTTP connections,
+    # which are reused for all writes, and compresses the written data with gzip
+    # (unless disabled in the configuration file).
     client = influxdb_client.InfluxDBClient(
         url=DB_URL,
         token=DB_TOKEN,
-        org=DB_ORG
+        org=DB_ORG,
+        enable_gzip=DB_GZIP,
+        connection_pool_maxsize=4
     )
+    # Points are collected over each update cycle and written in bounded batches by
+    # `flush_points`, so the synchronous write API is used
     write_api = client.write_api(write_options=SYNCHRONOUS)
 
-    def write_value(device, channel_id, value):
+    # Points (in line protocol) queued to be written to the database
+    pending_points = []
+
+    def flush_points():
         """
-        Write a new measured value to the InfluxDB database.
+        Write all queued points to the InfluxDB database,
+        in batches of at most `MAX_BATCH_SIZE` points.
+        """
+        points = iter(pending_points)
+        while batch := list(itertools.islice(points, MAX_BATCH_SIZE)):
+            try:
+                write_api.write(
+                    DB_BUCKET, DB_ORG, batch)
+            except (InfluxDBError, urllib3.exceptions.HTTPError) as e:
+                logger.warning('Could not write %d point(s) to database: %s', len(batch), e)
+            else:
+                logger.debug('Wrote %d point(s) to database', len(batch))
+        pending_points.clear()
+
+    # Whether the connection to the database has been closed by `shutdown`
+    database_closed = False
+
+    def shutdown():
+        """
+        Write all queued points to the database and close the connection.
+        Does nothing if the connection has already been closed.
+        """
+        global database_closed
+        if database_closed:
+            return
+        database_closed = True
+        flush_points()
+        write_api.close()
+        client.close()
+
+    # Fallback for exits before the main loop is entered; the main loop itself calls `shutdown`
+    # when it ends, i.e., before the interpreter shuts down
+    atexit.register(shutdown)
+
+    def write_values(device, readings, timestamp):
+        """
+        Queue the measured values of a device readout to be written to the InfluxDB database.
+        Values of channels with the same measurement and tags are combined into a single point
+        with multiple fields.
+        The queued points of all devices are written by `flush_points`, which is called once
+        per update cycle.
 
         device : dict
             Configuration dict of the device.
-        channel_id : str
-            ID of the measurement channel.
-        value : float
-            Measured value.
+        readings : dict
+            Measured values (float) by ID of the measurement channel (str).
+        timestamp : int
+            Time of measurement (in ns since the epoch).
         """
-        channel = device['Channels'][channel_id]
-        tags = {
-            'device': device['Device'],
-            **device['tags']
-        }
-        tags.update(channel.get("tags", {}))
-        if 'Multiplier' in channel:
-            value *= channel['Multiplier']
-        if 'Converter' in channel and channel['Converter'].get('Type') == 'polynomial':
-            coeffs_dict = channel['Converter'].get('Coefficients', {})
-            coeffs = np.array(list(coeffs_dict.values()))
-            exponents = np.array(list(coeffs_dict.keys())).astype(int)
-            value = np.sum(coeffs*value**exponents)
-        json_body = [
-            {
-                'measurement': device['measurement'],
-                'fields': {channel['field-key']: value},
-                'tags': tags
-            }
-        ]
-        unit_str = ' '+tags.get('unit') if tags.get('unit') is not None else ''
-        logger.info('Channel \'%s\': %s%s', channel_id, value, unit_str)
-        try:
-            write_api.write(
-                DB_BUCKET, DB_ORG, json_body)
-        except InfluxDBError as e:
-            logger.warning(f'Could not write to database: {e}')
+        # Formatted field values by field key, by series (measurement and tags)
+        fields_by_series = {}
+        for channel_id, value in readings.items():
+            channel = device['Channels'][channel_id]
+            # Skip missing and invalid (NaN or infinite) values, as returned by some devices,
+            # e.g., when out of range
+            if value is None or (
+                    isinstance(value, (float, np.floating)) and not math.isfinite(value)):
+                logger.debug('Channel \'%s\': Skipping invalid value %s', channel_id, value)
+                continue
+            if (multiplier := channel['_multiplier']) is not None:
+                value *= multiplier
+            if (polynomial := channel['_polynomial']) is not None:
+                coeffs, exponents = polynomial
+                value = np.sum(coeffs*value**exponents)
+            if log_info:
+                logger.info('Channel \'%s\': %s%s', channel_id, value, channel['_unit_str'])
+            field_value = format_field_value(value)
+            if field_value is None:
+                continue
+            fields_by_series.setdefault(
+                channel['_lp_series'], {})[channel['_lp_field_key']] = field_value
+        for series, fields in fields_by_series.items():
+            fields_str = ','.join([f'{key}={value}' for key, value in fields.items()])
+            pending_points.append(f'{series} {fields_str} {timestamp}')
 
-    logger.info('Reading device configuration from file \'%s\'',
-                device_config_path)
+    # Configuration dicts and instances of the loaded devices, as lists of tuples keyed by the
+    # serialized configuration of the device as read from the device configuration file
+    loaded_devices = {}
+
+    def load_devices():
+        """
+        Read the device configuration file and initialize the devices.
+        Devices whose configuration is unchanged since the last call keep their instance,
+        and thus their connection. Devices that were removed from or changed in the
+        configuration file are closed before the new devices are initialized.
+        Devices that could not be initialized are skipped. If the configuration file cannot be
+        read or contains an unknown device model, an exception is raised before any device
+        is closed, and the loaded devices are kept.
+        Returns the list of configuration dicts and the list of instances of the devices.
+        """
+        devices = read_device_config(device_config_path)
+        keys = [orjson.dumps(device) for device in devices]
+        # Check all device models before closing any devices
+        for device in devices:
+            get_device_module(device['Model'])
+        previous_devices = {key: list(entries) for key, entries in loaded_devices.items()}
+        reused_devices = [
+            previous_devices[key].pop() if previous_devices.get(key) else None for key in keys]
+        for entries in previous_devices.values():
+            for device, device_instance in entries:
+                close_device(device, device_instance)
+        new_loaded_devices = {}
+        initialized_devices = []
+        device_instances = []
+        for device, key, reused_device in zip(devices, keys, reused_devices):
+            if reused_device is not None:
+                device, device_instance = reused_device
+            else:
+                try:
+                    prepare_channels(device)
+                    device_instance = init_device(device)
+                except (LoggerError, DeviceError, KeyError, OSError) as err:
+                    logger.error(
+                        'Could not initialize device \'%s\', skipping device. Error: %s',
+                        device.get('Device'), getattr(err, 'value', err))
+                    continue
+                if device_instance is None:
+                    continue
+            new_loaded_devices.setdefault(key, []).append((device, device_instance))
+            initialized_devices.append(device)
+            device_instances.append(device_instance)
+        loaded_devices.clear()
+        loaded_devices.update(new_loaded_devices)
+        return initialized_devices, device_instances
+
+    def setup_readouts(devices, device_instances):
+        """
+        Set up readout of the devices with configuration dicts `devices` (list) and instances
+        `device_instances` (list).
+        Returns the thread pool used to read out the devices concurrently and the list of devices
+        read out in each update cycle, as tuples of the configuration dict of the device,
+        the (bound) readout method of the device instance, and the lock of the device.
+        """
+        # Devices sharing an address (e.g., several gauges on one RS-485 bus) share a lock and
+        # are read out one at a time.
+        executor = ThreadPoolExecutor(max_workers=max(len(devices), 1))
+        address_locks = {}
+        device_locks = [
+            address_locks.setdefault(address, threading.Lock())
+            if (address := device.get('Address')) is not None else threading.Lock()
+            for device in devices]
+        # Devices with `ParallelReadout` set to False are currently not read out, as reading out
+        # individual channels is not implemented yet:
+        # for current_channel in current_device["Channels"]:
+        #     try:
+        #         measured_value = current_device["Object"].get_value(
+        #             current_channel["DeviceChannel"])
+        #     except (ValueError, IOError) as err:
+        #         LOG.error("Could not get measurement value. Error: %s", err)
+        #         continue
+        #     write_values(current_device, {current_channel: measured_value}, time.time_ns())
+        readouts = [
+            (device, instance.get_values, lock)
+            for device, instance, lock in zip(devices, device_instances, device_locks)
+            if device.get('ParallelReadout', True)]
+        return executor, readouts
+
+    executor, readouts = setup_readouts(*load_devices())
+    # Modification time of device configuration file, used to detect changes
+    device_config_mtime = device_config_path.stat().st_mtime if args.watch else None
+
+    def read_device(get_values, lock):
+        """
+        Read out device with readout method `get_values` while holding lock `lock`.
+        Returns the readings and the time of the readout (in ns since the epoch),
+        which is used as common timestamp of all readings.
+        """
+        with lock:
+            readings = get_values()
+        return readings, time.time_ns()
+
+    # Stop main loop when receiving SIGTERM (e.g., from `systemctl stop`), so that all queued
+    # points are written to the database before exiting
+    stop_event = threading.Event()
+
+    def handle_sigterm(signum, frame):
+        """Handle SIGTERM signal by requesting main loop to stop."""
+        logger.info('Received SIGTERM, stopping logger')
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+    # Whether the measured values and read out devices are logged in each update cycle.
+    # The log level is not changed while running, so this is only checked once.
+    log_info = logger.isEnabledFor(logging.INFO)
+
+    # Write all queued points to the database and close the connection when the main loop
+    # ends, e.g., on SIGTERM or Ctrl-C
     try:
-        with open(device_config_path) as device_config:
-            devices = json.load(device_config)
-    except FileNotFoundError as e:
-        msg = f'Could not read device configuration file \'{device_config_path}\': {e}'
-        logger.error(msg)
-        raise LoggerError(msg)
-    device_instances = []
-    for i_device, device in enumerate(devices):
-        device_instances.append(init_device(device))
-    while True:
+        # Start of next update cycle (using monotonic clock)
+        next_update = time.monotonic()
+        while not stop_event.is_set():
 
-        try:
+            try:
 
-            for device, instance in zip(devices, device_instances):
-                if device.get('Address') is not None:
-                    logger.info(
-                        'Reading device: \'%s\' at \'%s\'', device['Device'], device['Address'])
-                else:
-                    logger.info('Reading device: \'%s\'', device['Device'])
-                if device.get('ParallelReadout', True):
+                # Reload device configuration file if it has been modified
+                if args.watch:
+                    try:
+                        mtime = device_config_path.stat().st_mtime
+                    except OSError:
+                        # File is possibly being replaced, try again in next update cycle
+                        mtime = device_config_mtime
+                    if mtime != device_config_mtime:
+                        device_config_mtime = mtime
+                        logger.info('Device configuration file has been modified, reloading')
+                        try:
+                            devices, device_instances = load_devices()
+                        except (
+                                LoggerError, DeviceError, KeyError, OSError, ImportError,
+                                orjson.JSONDecodeError) as err:
+                            logger.error(
+                                'Could not reload device configuration, keeping current devices.'
+                                +' Error: %s', getattr(err, 'value', err))
+                        else:
+                            executor.shutdown()
+                            executor, readouts = setup_readouts(devices, device_instances)
+
+                futures = {}
+                for device, get_values, lock in readouts:
+                    if log_info:
+                        if device.get('Address') is not None:
+                            logger.info(
+                                'Reading device: \'%s\' at \'%s\'',
+                                device['Device'], device['Address'])
+                        else:
+                            logger.info('Reading device: \'%s\'', device['Device'])
+                    futures[executor.submit(read_device, get_values, lock)] = device
+                for future in as_completed(futures):
+                    device = futures[future]
                     try:
-                        readings = instance.get_values()
+                        readings, timestamp = future.result()
                     except (LoggerError, DeviceError) as err:
                         logger.error(
-                            'Could not get measurement values. Error: %s', err.value)
+                            'Could not get measurement values of device \'%s\'. Error: %s',
+                            device['Device'], err.value)
                         continue
-                    for channel_id, value in readings.items():
-                        write_value(device, channel_id, value)
-                # else:
-                #     for current_channel in current_device["Channels"]:
-                #         try:
-                #             measured_value = current_device["Object"].get_value(
-                #                 current_channel["DeviceChannel"])
-                #         except (ValueError, IOError) as err:
-                #             LOG.error("Could not get measurement value. Error: %s", err)
-                #             continue
-                #         write_value(current_device, current_channel, measured_value)
-
-            time.sleep(UPDATE_INTERVAL)
-
-        except KeyboardInterrupt:
-            break
+                    write_values(device, readings, timestamp)
+
+                flush_points()
+                # Wait until start of next update cycle, keeping a fixed update interval
+                # independent of the time needed to read out the devices
+                next_update += UPDATE_INTERVAL
+                sleep_time = next_update - time.monotonic()
+                if sleep_time > 0:
+                    stop_event.wait(sleep_time)
+                else:
+                    logger.warning(
+                        'Update cycle took longer than update interval (%s s)', UPDATE_INTERVAL)
+                    # If more than one update interval behind, skip missed update cycles instead of
+                    # running them back to back
+                    if sleep_time < -UPDATE_INTERVAL:
+                        next_update = time.monotonic()
+
+            except KeyboardInterrupt:
+                break
+    finally:
+        shutdown()
@@ -5,6 +5,7 @@ Writes random numbers to measurement "test".
 
 """
 import configparser
+import functools
 import time
 import logging
 import random
@@ -14,28 +15,47 @@ from influxdb_client.client.write_api import SYNCHRONOUS
 
 LOG = logging.getLogger()
 
-# Read config file
 CONFIGPATH = "config.ini"
 
-CONF = configparser.ConfigParser()
-CONF.read(CONFIGPATH)
+# Character escapes of InfluxDB line protocol for measurement names, and for tag keys,
+# tag values, and field keys
+_LP_ESCAPE_MEASUREMENT = str.maketrans({
+    ",": r"\,", " ": r"\ ", "\n": r"\n", "\t": r"\t", "\r": r"\r"})
+_LP_ESCAPE_KEY = str.maketrans({
+    ",": r"\,", "=": r"\=", " ": r"\ ", "\n": r"\n", "\t": r"\t", "\r": r"\r"})
 
-DB_URL = CONF["Database"]["url"]
-DB_BUCKET = CONF["Database"]["bucket"]
-DB_ORG = CONF["Database"]["org"]
-DB_TOKEN = CONF["Database"]["token"]
-UPDATE_INTERVAL = int(CONF["Update"]["interval"])
-TIMEOUT = int(CONF["Devices"]["timeout"])
+@functools.lru_cache(maxsize=None)
+def load_config(config_path=CONFIGPATH):
+    """
+    Read config file and return it as `configparser.ConfigParser` instance.
+    The config file is only read on the first call for a given path.
+    """
+    conf = configparser.ConfigParser()
+    conf.read(config_path)
+    return conf
 
-DEVICE_CONFIG_PATH = CONF["Devices"]["configpath"]
+def lp_prefix(device, channel):
+    """
+    Return the line protocol of points of the channel up to the field value, i.e.,
+    the measurement, the (escaped) tags, and the field key.
+    The prefix is computed on the first call and stored in the configuration dict of the channel.
 
-# Set up database connection
-client = influxdb_client.InfluxDBClient(
-   url=DB_URL,
-   token=DB_TOKEN,
-   org=DB_ORG
-)
-write_api = client.write_api(write_options=SYNCHRONOUS)
+    :device: Configuration dict of the device
+    :channel: Configuration dict of the measurement channel
+    """
+    prefix = channel.get("_lp_prefix")
+    if prefix is None:
+        # Tags of device, merged with tags of channel
+        tags = {**device["tags"], **channel.get("tags", {})}
+        # Tags are sorted by key and empty tags are skipped, as done by influxdb-client
+        tags_str = "".join([
+            f",{str(key).translate(_LP_ESCAPE_KEY)}={str(tag).translate(_LP_ESCAPE_KEY)}"
+            for key, tag in sorted(tags.items())
+            if tag is not None and tag != ""])
+        prefix = channel["_lp_prefix"] = (
+            f"{device['measurement'].translate(_LP_ESCAPE_MEASUREMENT)}{tags_str}"
+            + f" {channel['field-key'].translate(_LP_ESCAPE_KEY)}=")
+    return prefix
 
 def write_value(device, channel, value):
     """
@@ -45,20 +65,31 @@ def write_value(device, channel, value):
     :channel_id: Configuration dict of the measurement channel
     :value: Measured value
     """
-    tags = device["tags"]
-    tags.update(channel.get("tags", {}))
     if "Multiplier" in channel:
         value *= channel["Multiplier"]
-    json_body = [
-        {
-            "measurement": device["measurement"],
-            "fields": {channel["field-key"]: value},
-            "tags": tags
-        }
-    ]
+    # Point in line protocol, with timestamp in ns
+    point = f"{lp_prefix(device, channel)}{float(value)!r} {time.time_ns()}"
     LOG.info("Channel %d: %s", channel["DeviceChannel"], value)
+    conf = load_config()
+    _, write_api = get_client()
     write_api.write(
-        DB_BUCKET, DB_ORG, json_body)
+        conf["Database"]["bucket"], conf["Database"]["org"], point)
+
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """
+    Set up database connection and return the client and its write API.
+    The client is only created on the first call.
+    """
+    conf = load_config()
+    client = influxdb_client.InfluxDBClient(
+       url=conf["Database"]["url"],
+       token=conf["Database"]["token"],
+       org=conf["Database"]["org"]
+    )
+    # Write synchronously, so that connection errors are reported immediately
+    write_api = client.write_api(write_options=SYNCHRONOUS)
+    return client, write_api
 
 def _setup_logging():
     """Configure the application logging setup."""
@@ -66,16 +97,33 @@ def _setup_logging():
 
 if __name__ == "__main__":
     _setup_logging()
-    while True:
-        value = random.random()
-        device = {
-            "measurement": "test",
-            "tags": {"device": "random-number-gen"},
-            }
-        channel = {
-            "DeviceChannel": 1,
-            "field-key": "value",
-            }
-        write_value(device, channel, value)
-
-        time.sleep(UPDATE_INTERVAL)
+
+    # Read config file
+    CONF = load_config()
+
+    UPDATE_INTERVAL = int(CONF["Update"]["interval"])
+
+    # Set up database connection
+    client, _ = get_client()
+
+    device = {
+        "measurement": "test",
+        "tags": {"device": "random-number-gen"},
+        }
+    channel = {
+        "DeviceChannel": 1,
+        "field-key": "value",
+        }
+    try:
+        # Start of next update cycle (using monotonic clock)
+        next_update = time.monotonic()
+        while True:
+            value = random.random()
+            write_value(device, channel, value)
+
+            # Wait until start of next update cycle, keeping a fixed update interval
+            # independent of the time needed to write the value
+            next_update += UPDATE_INTERVAL
+            time.sleep(max(0, next_update - time.monotonic()))
+    finally:
+        client.close()